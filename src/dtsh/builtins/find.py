@@ -134,9 +134,9 @@ class DTShBuiltinFind(DTShCommandLongFmt):
     def _output_nodes_raw(
         self, path2node: Mapping[str, DTNode], count: int, out: DTShOutput
     ) -> None:
-        # Output paths of found nodes.
-        for path in path2node:
-            out.write(path)
+        # Output paths of found nodes, all at once.
+        if path2node:
+            out.write("\n".join(path2node))
         if self.with_flag(DTShFlagCount):
             out.write()
             self._output_count_raw(count, out)
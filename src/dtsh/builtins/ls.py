@@ -109,8 +109,9 @@ class DTShBuiltinLs(DTShCommandLongFmt):
     def _output_nodes_raw(
         self, path2node: Mapping[str, DTNode], out: DTShOutput
     ) -> None:
-        for path in path2node:
-            out.write(path)
+        if path2node:
+            # Write all paths at once, rather than one write per node.
+            out.write("\n".join(path2node))
 
     def _output_nodes_longfmt(
         self, path2node: Mapping[str, DTNode], out: DTShOutput
@@ -181,8 +182,8 @@ class DTShBuiltinLs(DTShCommandLongFmt):
             if N > 1:
                 out.write(f"{dirpath}:")
 
-            for node in contents:
-                out.write(node.name)
+            if contents:
+                out.write("\n".join(node.name for node in contents))
 
             if i != N - 1:
                 # Insert empty line between "directories".
@@ -207,6 +207,11 @@ class DTShConfig:
         """Maximum width in number characters for command output redirection."""
         return self.getint("pref.redir2_maxwidth")
 
+    @property
+    def pref_history_maxlen(self) -> int:
+        """Maximum number of command lines in the history file."""
+        return self.getint("pref.history_maxlen")
+
     @property
     def pref_always_longfmt(self) -> bool:
         """Whether to assume the flag "use long listing format" is always set."""
@@ -588,34 +593,41 @@ class DTShConfig:
         else:
             self._app_dir = self._init_app_dir_posix()
 
-        if not os.path.isdir(self._app_dir):
-            try:
-                os.makedirs(self._app_dir, mode=0o750)
-            except OSError as e:
-                print(
-                    f"Failed to create directory: {self._app_dir}",
-                    file=sys.stderr,
-                )
-                print(f"Cause: {e}", file=sys.stderr)
+        try:
+            # Don't check-then-create: with exist_ok, another process
+            # creating the directory in between won't make us fail.
+            os.makedirs(self._app_dir, mode=0o750, exist_ok=True)
+        except OSError as e:
+            print(
+                f"Failed to create directory: {self._app_dir}",
+                file=sys.stderr,
+            )
+            print(f"Cause: {e}", file=sys.stderr)
 
     def _init_app_dir_darwin(self) -> str:
         return os.path.abspath(
-            os.path.join(os.path.expanduser("~"), "Library", "DTSh")
+            os.path.join(self._get_home_dir(), "Library", "DTSh")
         )
 
     def _init_app_dir_nt(self) -> str:
-        local_app_data = os.environ.get(
-            "LOCALAPPDATA",
-            os.path.join(os.path.expanduser("~"), "AppData", "Local"),
+        # Don't expand "~" unless LOCALAPPDATA is actually unset.
+        local_app_data = os.environ.get("LOCALAPPDATA") or os.path.join(
+            os.path.expanduser("~"), "AppData", "Local"
         )
         return os.path.abspath(os.path.join(local_app_data, "DTSh"))
 
     def _init_app_dir_posix(self) -> str:
-        xdg_cfg_home = os.environ.get(
-            "XDG_CONFIG_HOME",
-            os.path.join(os.path.expanduser("~"), ".config"),
+        # Don't expand "~" unless XDG_CONFIG_HOME is actually unset
+        # (or empty, which the XDG specification treats the same).
+        xdg_cfg_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+            self._get_home_dir(), ".config"
         )
         return os.path.abspath(os.path.join(xdg_cfg_home, "dtsh"))
 
+    def _get_home_dir(self) -> str:
+        # POSIX: the common case is a plain environment lookup,
+        # expanduser() may fall back to the password database.
+        return os.environ.get("HOME") or os.path.expanduser("~")
+
 
 _dtshconf = DTShConfig()
@@ -40,7 +40,6 @@ from typing import (
 )
 
 import os
-import re
 import sys
 
 import yaml
@@ -483,6 +482,9 @@ class CMakeCache:
     Adapted from zcmake.CMakeCache.
     """
 
+    READ_BUFSIZE = 65536
+    """Buffer size for reading CMake cache files."""
+
     _entries: Dict[str, "CMakeCacheEntry"]
 
     @classmethod
@@ -513,12 +515,16 @@ class CMakeCache:
             OSError: CMakeCache file error.
             ValueError: CMakeCache content error.
         """
-        with open(path, "r", encoding="utf-8") as cache:
-            entries = [
-                CMakeCacheEntry.from_line(line, line_no)
-                for line_no, line in enumerate(cache)
-            ]
-        self._entries = {entry.name: entry for entry in entries if entry}
+        self._entries = {}
+        # Parse the cache file as lines are read, without materializing
+        # all lines (or all entries) before we build the index.
+        with open(
+            path, "r", encoding="utf-8", buffering=CMakeCache.READ_BUFSIZE
+        ) as cache:
+            for line_no, line in enumerate(cache):
+                entry = CMakeCacheEntry.from_line(line, line_no)
+                if entry:
+                    self._entries[entry.name] = entry
 
     def get(self, name: str) -> Optional["CMakeCacheEntry.ValueType"]:
         """Access a cache entry by name.
@@ -617,19 +623,17 @@ class CMakeCacheEntry:
     Adapted from zcmake.CMakeCacheEntry.
     """
 
-    # Regular expression for a cache entry.
-    #
-    # CMake variable names can include escape characters, allowing a
-    # wider set of names than is easy to match with a regular
-    # expression. To be permissive here, use a non-greedy match up to
-    # the first colon (':'). This breaks if the variable name has a
-    # colon inside, but it's good enough.
-    CACHE_ENTRY = re.compile(
-        r"""(?P<name>.*?)
-         :(?P<type>FILEPATH|PATH|STRING|BOOL|INTERNAL|STATIC|UNINITIALIZED)
-         =(?P<value>.*)
-        """,
-        re.X,
+    # Cache entry types.
+    CACHE_TYPES = frozenset(
+        (
+            "FILEPATH",
+            "PATH",
+            "STRING",
+            "BOOL",
+            "INTERNAL",
+            "STATIC",
+            "UNINITIALIZED",
+        )
     )
 
     ValueType = Union[str, List[str], bool]
@@ -654,29 +658,37 @@ class CMakeCacheEntry:
         """
         # Comments can only occur at the beginning of a line.
         # (The value of an entry could contain a comment character).
-        if line.startswith("//") or line.startswith("#"):
+        if line.startswith(("//", "#")):
             return None
 
-        # Whitespace-only lines do not contain cache entries.
-        if not line.strip():
+        # Cache entries are "NAME:TYPE=VALUE" lines: split on the first "=",
+        # since the value may contain "=" or ":" characters, then
+        # on the last ":". CMake variable names can include escape
+        # characters, allowing a wider set of names than is easy
+        # to match with a regular expression: this permits names to
+        # contain colons. This breaks if the variable name has an equal
+        # sign inside, but it's good enough.
+        head, eq, strval = line.partition("=")
+        if not eq:
+            # Also skips empty and whitespace-only lines.
             return None
-
-        m = cls.CACHE_ENTRY.match(line)
-        if not m:
+        name, colon, type_ = head.rpartition(":")
+        if not colon or type_ not in cls.CACHE_TYPES:
             return None
+        strval = strval.rstrip("\n")
 
-        name, type_, value = (m.group(g) for g in ("name", "type", "value"))
+        value: CMakeCacheEntry.ValueType = strval
         if type_ == "BOOL":
             try:
-                value = cls._to_bool(value)
+                value = cls._to_bool(strval)
             except ValueError as exc:
                 args = exc.args + (f"on line {line_no}: {line}",)
                 raise ValueError(args) from exc
         elif type_ in {"STRING", "INTERNAL", "STATIC", "UNINITIALIZED"}:
             # If the value is a CMake list (i.e. is a string which
             # contains a ';'), convert to a Python list.
-            if ";" in value:
-                value = value.split(";")
+            if ";" in strval:
+                value = strval.split(";")
 
         return CMakeCacheEntry(name, value)
 
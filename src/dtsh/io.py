@@ -87,6 +87,17 @@ class DTShVT(DTShInput, DTShOutput):
     and ignores paging.
     """
 
+    # Whether stdin is a terminal.
+    _isatty: bool
+
+    def __init__(self) -> None:
+        """Initialize VT."""
+        self._isatty = sys.stdin.isatty()
+
+    def is_tty(self) -> bool:
+        """Overrides DTShInput.is_tty()."""
+        return self._isatty
+
     def readline(self, multi_prompt: Optional[Sequence[Any]] = None) -> str:
         r"""Print the prompt and read a command line.
 
@@ -100,8 +111,18 @@ class DTShVT(DTShInput, DTShOutput):
             <START_IGNORE> := \001
             <END_IGNORE> := \002
 
+        When stdin is not a terminal (e.g. piped command lines),
+        won't print the prompt, and won't go through GNU readline.
+
         Overrides DTShInput.readline().
         """
+        if not self._isatty:
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError()
+            # Strip trailing "\n".
+            return line.rstrip("\n")
+
         multi_prompt = multi_prompt or ["> "]
         preamble: Sequence[Any] = multi_prompt[:-1]
         prompt: str = multi_prompt[-1]
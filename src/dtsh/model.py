@@ -1072,6 +1072,9 @@ class DTNode(DTWalkable):
     # (All) properties, lazy initialized.
     _props: Dict[str, DTNodeProperty]
 
+    # Unit-name, lazy initialized.
+    _unit_name: Optional[str]
+
     def __init__(
         self,
         edtnode: edtlib.Node,
@@ -1100,6 +1103,7 @@ class DTNode(DTWalkable):
         self._binding = self._dt.get_device_binding(self)
         # Initialized on first access.
         self._props = {}
+        self._unit_name = None
 
     @property
     def dt(self) -> "DTModel":
@@ -1123,7 +1127,11 @@ class DTNode(DTWalkable):
         The term unit-name is not widely used for the node-name component
         of node names: for an example, see in DTSpec 3.4. /memory node.
         """
-        return self._edtnode.name.split("@")[0]
+        if self._unit_name is None:
+            # Node names don't change: split only once, when sorting
+            # or matching nodes by unit-name.
+            self._unit_name = self._edtnode.name.partition("@")[0]
+        return self._unit_name
 
     @property
     def unit_addr(self) -> Optional[int]:
@@ -1446,44 +1454,41 @@ class DTNode(DTWalkable):
         reverse: bool,
         enabled_only: bool,
         fixed_depth: int,
-        at_depth: int = 0,
     ) -> Iterator["DTNode"]:
-        if enabled_only and not node.enabled:
-            # Abort early on disabled branches when enabled_only is set.
-            return
-
-        # Yield branch and increment depth.
-        yield node
-        if fixed_depth > 0:
-            if at_depth == fixed_depth:
-                return
-            at_depth += 1
-
-        # Filter and sort children.
-        children = node.children
-        if enabled_only:
-            children = [child for child in children if child.enabled]
-        if order_by:
-            children = order_by.sort(children, reverse=reverse)
-        elif reverse:
-            children = list(reversed(children))
-
-        for child in children:
-            yield from self._walk(
-                child,
-                order_by=order_by,
-                reverse=reverse,
-                enabled_only=enabled_only,
-                fixed_depth=fixed_depth,
-                at_depth=at_depth,
-            )
+        # Depth-first walk with an explicit stack of (branch, depth) items,
+        # rather than recursing through nested generators: yielding a node
+        # won't cost one generator frame per level of depth.
+        stack: List[Tuple[DTNode, int]] = [(node, 0)]
+        while stack:
+            branch, at_depth = stack.pop()
+            if enabled_only and not branch.enabled:
+                # Abort early on disabled branches when enabled_only is set.
+                continue
+
+            yield branch
+            if fixed_depth > 0:
+                if at_depth == fixed_depth:
+                    continue
+
+            # Filter and sort children.
+            children = branch.children
+            if enabled_only:
+                children = [child for child in children if child.enabled]
+            if order_by:
+                children = order_by.sort(children, reverse=reverse)
+            elif reverse:
+                children = list(reversed(children))
+
+            # Push children in reverse order of traversal.
+            stack.extend((child, at_depth + 1) for child in reversed(children))
 
     def _rwalk(self, node: "DTNode") -> Iterator["DTNode"]:
         # Walk the subtree backward to the root node,
         # which is by convention its own parent.
         yield node
-        if node.parent != node:
-            yield from self._rwalk(node.parent)
+        while node.parent != node:
+            node = node.parent
+            yield node
 
     def _init_props(self) -> None:
         if not self._props:
@@ -726,19 +726,21 @@ class DTWalkableComb(DTWalkable):
         order_by: Optional[DTNodeSorter] = None,
         reverse: bool = False,
     ) -> Iterator[DTNode]:
-        if branch in self._comb:
-            yield branch
-            children = branch.children
-            if children:
-                if order_by:
-                    children = order_by.sort(children, reverse=reverse)
-                elif reverse:
-                    # Reverse DTS-order.
-                    children = list(reversed(children))
-                for child in children:
-                    yield from self._walk(
-                        child, order_by=order_by, reverse=reverse
-                    )
+        # Depth-first walk with an explicit stack, see DTNode._walk().
+        stack: List[Optional[DTNode]] = [branch]
+        while stack:
+            node = stack.pop()
+            if node in self._comb:
+                yield node
+                children = node.children
+                if children:
+                    if order_by:
+                        children = order_by.sort(children, reverse=reverse)
+                    elif reverse:
+                        # Reverse DTS-order.
+                        children = list(reversed(children))
+                    # Push children in reverse order of traversal.
+                    stack.extend(reversed(children))
 
 
 class DTSUtil:
@@ -871,7 +873,8 @@ class DTSUtil:
         Returns:
             An array of un-prefixed uppercase bytes, e.g. "[ C2 28 17 ]".
         """
-        strbytes = " ".join(f"{b:02X}" for b in value)
+        # Formatted by bytes.hex() (in C), not byte per byte.
+        strbytes = value.hex(" ").upper()
         return f"[ {strbytes} ]"
 
     @classmethod
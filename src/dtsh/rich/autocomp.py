@@ -5,7 +5,7 @@
 """Rich display callback for GNU readline integration."""
 
 
-from typing import Optional, Sequence, Set
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Type
 
 import os
 
@@ -55,43 +55,13 @@ class DTShRichAutocomp(DTShAutocomp):
         """
         grid = GridLayout(2, padding=(0, 4, 0, 0))
 
+        # Called on each TAB: dispatch on the state's type with a single
+        # dictionary lookup rather than walking an isinstance() chain.
+        views = DTShRichAutocomp._RLSTATE_VIEWS
         for state in states:
-            if isinstance(state, RlStateDTShCommand):
-                self._rlstates_view_add_dtshcmd(grid, state)
-
-            elif isinstance(state, RlStateDTShOption):
-                self._rlstates_view_add_dtshopt(grid, state)
-
-            elif isinstance(state, RlStateDTPath):
-                self._rlstates_view_add_dtpath(grid, state)
-
-            elif isinstance(state, RlStateCompatStr):
-                self._rlstates_view_add_compatstr(grid, state)
-
-            elif isinstance(state, RlStateDTVendor):
-                self._rlstates_view_add_vendor(grid, state)
-
-            elif isinstance(state, RlStateDTBus):
-                self._rlstates_view_add_bus(grid, state)
-
-            elif isinstance(state, RlStateDTAlias):
-                self._rlstates_view_add_alias(grid, state)
-
-            elif isinstance(state, RlStateDTChosen):
-                self._rlstates_view_add_chosen(grid, state)
-
-            elif isinstance(state, RlStateDTLabel):
-                self._rlstates_view_add_label(grid, state)
-
-            elif isinstance(state, RlStateDTProperty):
-                self._rlstates_view_add_dtprop(grid, state)
-
-            elif isinstance(state, RlStateFsEntry):
-                self._rlstates_view_add_fspath(grid, state)
-
-            elif isinstance(state, RlStateEnum):
-                self._rlstates_view_add_enum(grid, state)
-
+            view = views.get(type(state))
+            if view:
+                view(self, grid, state)
             else:
                 grid.add_row(state.rlstr, None)
 
@@ -124,7 +94,8 @@ class DTShRichAutocomp(DTShAutocomp):
             # look for description.
             if len(state.bindings) == 1:
                 # Single binding, use its description if any.
-                binding = state.bindings.pop()
+                # Don't pop(): completer states may be displayed again.
+                binding = next(iter(state.bindings))
                 if binding.description:
                     txt_desc = TextUtil.mk_headline(
                         binding.description, DTShTheme.STYLE_DT_DESCRIPTION
@@ -244,3 +215,22 @@ class DTShRichAutocomp(DTShAutocomp):
         self, grid: GridLayout, state: RlStateEnum
     ) -> None:
         grid.add_row(TextUtil.bold(state.value), state.brief)
+
+    # Completion views, by completer state type.
+    _RLSTATE_VIEWS: Dict[
+        Type[DTShReadline.CompleterState],
+        Callable[["DTShRichAutocomp", GridLayout, Any], None],
+    ] = {
+        RlStateDTShCommand: _rlstates_view_add_dtshcmd,
+        RlStateDTShOption: _rlstates_view_add_dtshopt,
+        RlStateDTPath: _rlstates_view_add_dtpath,
+        RlStateCompatStr: _rlstates_view_add_compatstr,
+        RlStateDTVendor: _rlstates_view_add_vendor,
+        RlStateDTBus: _rlstates_view_add_bus,
+        RlStateDTAlias: _rlstates_view_add_alias,
+        RlStateDTChosen: _rlstates_view_add_chosen,
+        RlStateDTLabel: _rlstates_view_add_label,
+        RlStateDTProperty: _rlstates_view_add_dtprop,
+        RlStateFsEntry: _rlstates_view_add_fspath,
+        RlStateEnum: _rlstates_view_add_enum,
+    }
@@ -17,7 +17,6 @@ import os
 
 from rich.console import Console, PagerContext
 from rich.measure import Measurement
-from rich.theme import Theme
 from rich.terminal_theme import (
     SVG_EXPORT_THEME,
     DEFAULT_TERMINAL_THEME,
@@ -46,7 +45,7 @@ class DTShRichVT(DTShVT):
     def __init__(self) -> None:
         """Initialize VT."""
         super().__init__()
-        self._console = Console(theme=Theme(_theme.styles), highlight=False)
+        self._console = Console(theme=_theme.rich_theme, highlight=False)
         self._pager = None
 
     def write(self, *args: Any, **kwargs: Any) -> None:
@@ -115,8 +114,8 @@ class DTShBatchRichVT(DTShRichVT):
         self._interactive = interactive
 
     def is_tty(self) -> bool:
-        """Overrides DTShInput.is_tty()."""
-        return self._batch_is is None
+        """Overrides DTShVT.is_tty()."""
+        return self._batch_is is None and super().is_tty()
 
     def readline(self, multi_prompt: Optional[Sequence[Any]] = None) -> str:
         """Overrides DTShVT.readline()."""
@@ -165,7 +164,7 @@ class DTShOutputFileText(DTShOutput):
 
         self._console = Console(
             highlight=False,
-            theme=Theme(_theme.styles),
+            theme=_theme.rich_theme,
             record=True,
             # Set the console's width to the configured maximum,
             # we'll strip the rich segments on flush.
@@ -228,7 +227,7 @@ class DTShOutputFileHtml(DTShOutput):
 
         self._console = Console(
             highlight=False,
-            theme=Theme(_theme.styles),
+            theme=_theme.rich_theme,
             record=True,
             # Set the console's width to the configured maximum,
             # we'll post-process the generated HTML document on flush.
@@ -355,7 +354,7 @@ class DTShOutputFileSVG(DTShOutput):
 
         self._console = Console(
             highlight=False,
-            theme=Theme(_theme.styles),
+            theme=_theme.rich_theme,
             record=True,
             # Set the console's width to the configured maximum,
             # we'll shrink it on flush.
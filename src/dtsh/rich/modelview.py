@@ -59,7 +59,7 @@ from dtsh.modelutils import (
     DTNodeSortByBus,
     DTSUtil,
 )
-from dtsh.config import DTShConfig
+from dtsh.config import DTShConfig, ActionableType
 
 from dtsh.rich.tui import View, TableLayout, GridLayout
 from dtsh.rich.text import TextUtil
@@ -320,7 +320,7 @@ class DTModelView:
         tv_addr = cls.mk_reg_addr(reg.address)
         if reg.size:
             tv_size = TextUtil.assemble("(", cls.mk_reg_size(reg.size), ")")
-            tv_reg = TextUtil.mk_text(" ").join((tv_addr, tv_size))
+            tv_reg = TextUtil.join(" ", (tv_addr, tv_size))
         else:
             tv_reg = tv_addr
         return tv_reg
@@ -391,6 +391,11 @@ class SketchMV:
     _reversed: bool
     _sorter: Optional[DTNodeSorter]
 
+    # Layout dependent preferences, resolved once per sketch
+    # (placeholders and links are made for many cells).
+    _placeholder: str
+    _action_type: ActionableType
+
     def __init__(
         self,
         layout: "SketchMV.Layout",
@@ -409,6 +414,24 @@ class SketchMV:
         self._sorter = sorter
         self._reversed = reverse
 
+        if layout == SketchMV.Layout.LIST_VIEW:
+            self._placeholder = _dtshconf.pref_list_placeholder
+            self._action_type = _dtshconf.pref_list_actionable_type
+        elif layout == SketchMV.Layout.TREE_VIEW:
+            self._placeholder = _dtshconf.pref_tree_placeholder
+            self._action_type = _dtshconf.pref_tree_actionable_type
+        elif layout == SketchMV.Layout.TWO_SIDED:
+            # NOTE: should we add a preference for this ?
+            self._placeholder = _dtshconf.pref_tree_placeholder
+            self._action_type = _dtshconf.pref_2Sided_actionable_type
+        elif layout == SketchMV.Layout.LIST_MULTI:
+            # NOTE: should we add a preference for this ?
+            self._placeholder = _dtshconf.pref_list_placeholder
+            # Use default.
+            self._action_type = _dtshconf.pref_actionable_type
+        else:
+            raise ValueError(layout)
+
     @property
     def layout(self) -> "SketchMV.Layout":
         """Rendering layout."""
@@ -440,21 +463,10 @@ class SketchMV:
         The actual placeholder character depends on the rendering layout
         and user preferences.
         """
-        placeholder: Optional[str] = None
-        if self._layout == SketchMV.Layout.LIST_VIEW:
-            placeholder = _dtshconf.pref_list_placeholder
-        elif self._layout == SketchMV.Layout.TREE_VIEW:
-            placeholder = _dtshconf.pref_tree_placeholder
-        elif self._layout == SketchMV.Layout.TWO_SIDED:
-            # NOTE: should we add a preference for this ?
-            placeholder = _dtshconf.pref_tree_placeholder
-        elif self._layout == SketchMV.Layout.LIST_MULTI:
-            # NOTE: should we add a preference for this ?
-            placeholder = _dtshconf.pref_list_placeholder
-        else:
-            raise ValueError(self._layout)
-
-        return TextUtil.mk_text(placeholder) if placeholder else None
+        # Answer a new text view: cells styles may change (e.g. disabled).
+        return (
+            TextUtil.mk_text(self._placeholder) if self._placeholder else None
+        )
 
     def link(self, text: Union[str, Text], uri: str) -> Text:
         """Link text.
@@ -469,18 +481,7 @@ class SketchMV:
         Return:
             An actionable text.
         """
-        if self._layout == SketchMV.Layout.LIST_VIEW:
-            action_type = _dtshconf.pref_list_actionable_type
-        elif self._layout == SketchMV.Layout.TREE_VIEW:
-            action_type = _dtshconf.pref_tree_actionable_type
-        elif self._layout == SketchMV.Layout.TWO_SIDED:
-            action_type = _dtshconf.pref_2Sided_actionable_type
-        elif self._layout == SketchMV.Layout.LIST_MULTI:
-            # Use default.
-            action_type = _dtshconf.pref_actionable_type
-        else:
-            raise ValueError(self._layout)
-        return TextUtil.link(text, uri, action_type)
+        return TextUtil.link(text, uri, self._action_type)
 
     def with_sorter(self, sorter_t: Type[DTNodeSorter]) -> bool:
         """Check if the rendering context includes a sorter.
@@ -1048,15 +1049,19 @@ class CompatibleNodeMV(NodeMV):
         else:
             compats = node.compatibles
 
+        # Resolve the node's bindings context once for all compatibles.
+        matching_compat = node.compatible
+        on_bus = node.on_bus
+
         tvs_compats: List[Text] = []
         for compat in compats:
             binding_path: Optional[str] = None
-            if compat == node.compatible:
+            if compat == matching_compat:
                 txt_compat = DTModelView.mk_binding_compat(compat)
                 binding_path = node.binding_path
             else:
                 txt_compat = DTModelView.mk_compat_str(compat)
-                binding = node.dt.get_compatible_binding(compat, node.on_bus)
+                binding = node.dt.get_compatible_binding(compat, on_bus)
                 if binding:
                     binding_path = binding.path
 
@@ -1065,7 +1070,8 @@ class CompatibleNodeMV(NodeMV):
 
             tvs_compats.append(txt_compat)
 
-        if sketch.layout == SketchMV.Layout.LIST_MULTI:
+        if sketch.layout == SketchMV.Layout.LIST_MULTI or len(tvs_compats) == 1:
+            # Nothing to join (a single compatible string is the common case).
             return tvs_compats
 
         return (TextUtil.join(" ", tvs_compats),)
@@ -1587,7 +1593,7 @@ class DTTypesMV:
         Returns:
             A styled text representation of value.
         """
-        strbytes = " ".join(f"{b:02X}" for b in value)
+        strbytes = value.hex(" ").upper()
         return TextUtil.assemble(
             TextUtil.mk_text("[ "),
             TextUtil.mk_text(strbytes, DTShTheme.STYLE_DTVALUE_UINT8),
@@ -1607,8 +1613,7 @@ class DTTypesMV:
         Returns:
             A styled text representation of the phandle.
         """
-        strval = DTSUtil.mk_phandle(node, as_cell=False)
-        txt_phandle = TextUtil.mk_text(strval, DTShTheme.STYLE_DTVALUE_PHANDLE)
+        txt_phandle = TextUtil.mk_text(*cls._mk_handle(node))
 
         if as_cell:
             txt_phandle = cls._mk_cell(txt_phandle)
@@ -1638,7 +1643,7 @@ class DTTypesMV:
             return cls._mk_cell(txt_array)
 
         return TextUtil.join(
-            TextUtil.mk_text(", "),
+            ", ",
             (cls.mk_int(val, as_cell=True) for val in int_arr),
         )
 
@@ -1654,9 +1659,7 @@ class DTTypesMV:
         Returns:
             A styled text representation of the string array.
         """
-        return TextUtil.join(
-            TextUtil.mk_text(", "), (cls.mk_string(val) for val in str_arr)
-        )
+        return TextUtil.join(", ", (cls.mk_string(val) for val in str_arr))
 
     @classmethod
     def mk_phandles(cls, phandles: List[DTNode]) -> Text:
@@ -1670,11 +1673,14 @@ class DTTypesMV:
         Returns:
             A styled text representation of the "phandles" value.
         """
-        txt_phandles = TextUtil.join(
-            TextUtil.mk_text(" "),
-            [cls.mk_phandle(node, as_cell=False) for node in phandles],
-        )
-        return cls._mk_cell(txt_phandles)
+        # Assemble styled handles into a single text view,
+        # rather than making (and joining) one per phandle.
+        parts: List[Union[str, Tuple[str, StyleType]]] = []
+        for node in phandles:
+            if parts:
+                parts.append(" ")
+            parts.append(cls._mk_handle(node))
+        return cls._mk_cell(TextUtil.assemble(*parts))
 
     @classmethod
     def mk_phandle_array(cls, phandle_array: List[DTNodePHandleData]) -> Text:
@@ -1689,7 +1695,7 @@ class DTTypesMV:
             A styled text representation of the "phandle-array" value.
         """
         return TextUtil.join(
-            TextUtil.mk_text(", "),
+            ", ",
             (
                 cls.mk_phandle_data(entry, as_cell=True)
                 for entry in phandle_array
@@ -1716,7 +1722,7 @@ class DTTypesMV:
         ]
 
         txt_phdata = TextUtil.join(
-            TextUtil.mk_text(" "),
+            " ",
             [
                 cls.mk_phandle(phdata.phandle, as_cell=False),
                 TextUtil.mk_text(
@@ -1729,6 +1735,14 @@ class DTTypesMV:
             txt_phdata = cls._mk_cell(txt_phdata)
         return txt_phdata
 
+    @classmethod
+    def _mk_handle(cls, node: DTNode) -> Tuple[str, StyleType]:
+        # Styled handle for a pointed-to DT node.
+        return (
+            DTSUtil.mk_phandle(node, as_cell=False),
+            DTShTheme.STYLE_DTVALUE_PHANDLE,
+        )
+
     @classmethod
     def _mk_cell(cls, content: Text) -> Text:
         return TextUtil.assemble(
@@ -10,10 +10,12 @@ Extend the base session with:
 - batch commands to execute on start-up, before or instead of user input
 """
 
-from typing import Any, Sequence, Optional, List, Union
+from typing import Any, Sequence, Optional, List, Tuple, Union
 
 import os
 
+from rich.text import Text
+
 from dtsh.config import DTShConfig
 from dtsh.shell import (
     DTSh,
@@ -40,10 +42,36 @@ from dtsh.rich.modelview import DTModelView
 
 _dtshconf: DTShConfig = DTShConfig.getinstance()
 
+# The rich shell banner does not depend on the session's state.
+_RICH_PROLOGUE: Sequence[Text] = (
+    TextUtil.join(
+        " ",
+        [
+            TextUtil.bold("dtsh"),
+            TextUtil.mk_text(f"({DTSh.VERSION_STRING}):"),
+            TextUtil.italic("A Devicetree Shell"),
+        ],
+    ),
+    TextUtil.assemble(
+        TextUtil.mk_text("How to exit: "),
+        TextUtil.bold("q"),
+        TextUtil.mk_text(", or "),
+        TextUtil.bold("quit"),
+        TextUtil.mk_text(", or "),
+        TextUtil.bold("exit"),
+        TextUtil.mk_text(", or press "),
+        TextUtil.bold("Ctrl-D"),
+    ),
+)
+
 
 class DTShRichSession(DTShSession):
     """Rich devicetree shell session."""
 
+    # Prompt preamble (current working branch view), by path name:
+    # re-created only when changing the current working branch.
+    _pwd_view: Optional[Tuple[str, Text]]
+
     @classmethod
     def create_batch(
         cls,
@@ -107,6 +135,7 @@ class DTShRichSession(DTShSession):
             vt: The session's VT, default to DTShRichVT.
         """
         super().__init__(sh, vt or DTShRichVT(), DTShRichAutocomp(sh))
+        self._pwd_view = None
 
     def open_redir2(self, redir2: str) -> DTShOutput:
         """Overrides DTShSession.open_redir2().
@@ -167,34 +196,17 @@ class DTShRichSession(DTShSession):
 
     def mk_prompt(self) -> Sequence[Any]:
         """Overrides DTShVT.mk_prompt()."""
+        pwd = self._dtsh.pwd
+        if not self._pwd_view or self._pwd_view[0] != pwd:
+            self._pwd_view = (pwd, DTModelView.mk_path_name(pwd))
         return [
-            DTModelView.mk_path_name(self._dtsh.pwd),
-            _dtshconf.prompt_alt
-            if self._last_err
-            else _dtshconf.prompt_default,
+            self._pwd_view[1],
+            self._prompt_alt if self._last_err else self._prompt_default,
         ]
 
     def mk_prologue(self) -> Sequence[Any]:
         """Overrides DTShSession.mk_prologue()."""
-        txt_banner = TextUtil.join(
-            " ",
-            [
-                TextUtil.bold("dtsh"),
-                TextUtil.mk_text(f"({DTSh.VERSION_STRING}):"),
-                TextUtil.italic("A Devicetree Shell"),
-            ],
-        )
-        txt_howto = TextUtil.assemble(
-            TextUtil.mk_text("How to exit: "),
-            TextUtil.bold("q"),
-            TextUtil.mk_text(", or "),
-            TextUtil.bold("quit"),
-            TextUtil.mk_text(", or "),
-            TextUtil.bold("exit"),
-            TextUtil.mk_text(", or press "),
-            TextUtil.bold("Ctrl-D"),
-        )
-        return [txt_banner, txt_howto]
+        return _RICH_PROLOGUE
 
     def mk_epilogue(self) -> Sequence[Any]:
         """Overrides DTShSession.mk_epilogue()."""
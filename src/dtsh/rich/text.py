@@ -8,7 +8,7 @@ Factories for styled and actionable (aka linked) rich text views,
 and miscellaneous text related helpers.
 """
 
-from typing import Optional, Union, Iterable
+from typing import Dict, Optional, Union, Iterable, Tuple
 
 from urllib.parse import urlparse
 import os
@@ -28,6 +28,12 @@ _dtshconf: DTShConfig = DTShConfig.getinstance()
 class TextUtil:
     """Text view factories."""
 
+    # File URIs by absolute path, see link().
+    _file_uris: Dict[str, str] = {}
+
+    # Default style separators, see join().
+    _separators: Dict[str, Text] = {}
+
     @classmethod
     def mk_text(
         cls,
@@ -171,7 +177,7 @@ class TextUtil:
         scheme = urlparse(uri).scheme
         if not scheme:
             # Assume "file" URI scheme when missing.
-            uri = pathlib.Path(os.path.abspath(uri)).as_uri()
+            uri = cls._mk_file_uri(uri)
 
         if linktype is ActionableType.ALT:
             # Append actionable text.
@@ -250,16 +256,36 @@ class TextUtil:
     def join(cls, sep: Union[str, Text], parts: Iterable[Text]) -> Text:
         """Join rich text elements."""
         if isinstance(sep, str):
-            sep = cls.mk_text(sep)
+            # Text.join() won't modify the separator: list and tree views
+            # may then share the same few (e.g. ", ") for all nodes.
+            tv_sep = cls._separators.get(sep)
+            if tv_sep is None:
+                tv_sep = cls.mk_text(sep)
+                cls._separators[sep] = tv_sep
+            sep = tv_sep
         return sep.join(parts)
 
     @classmethod
-    def assemble(cls, *parts: Union[Text, str]) -> Text:
+    def assemble(cls, *parts: Union[Text, str, Tuple[str, StyleType]]) -> Text:
         """Assemble Text views into one.
 
         Args:
-            parts: The views to assemble.
+            parts: The views to assemble, or (content, style) pairs.
         """
         # Note: Text.append_tokens(), Text.append_text() and such
         # would "merge" the Text styles.
         return Text.assemble(*parts)
+
+    @classmethod
+    def _mk_file_uri(cls, path: str) -> str:
+        # Links to the same files (e.g. YAML bindings) are created over
+        # and over in list and tree views: cache the URIs of absolute paths,
+        # rather than going through pathlib for each link.
+        if not os.path.isabs(path):
+            # Relative paths depend on the current working directory.
+            return pathlib.Path(os.path.abspath(path)).as_uri()
+        uri = cls._file_uris.get(path)
+        if uri is None:
+            uri = pathlib.Path(os.path.normpath(path)).as_uri()
+            cls._file_uris[path] = uri
+        return uri
@@ -115,6 +115,10 @@ class DTShTheme:
     # Rich styles.
     _styles: Dict[str, Style]
 
+    # Rich theme for these styles, built on first use
+    # (and again after a theme file is loaded).
+    _rich_theme: Optional[Theme]
+
     def __init__(self, path: Optional[str] = None) -> None:
         """Initialize DTSh theme.
 
@@ -131,6 +135,7 @@ class DTShTheme:
               or None for default theme initialization.
         """
         self._styles = {}
+        self._rich_theme = None
 
         if path:
             # If explicitly specified, load only this one: fault if invalid.
@@ -152,6 +157,18 @@ class DTShTheme:
         """The theme's rich styles."""
         return self._styles
 
+    @property
+    def rich_theme(self) -> Theme:
+        """The rich theme to configure consoles with.
+
+        All consoles (VT and redirection streams) share the same theme
+        instance, rather than re-resolving the DTSh and rich default styles
+        for each new console.
+        """
+        if not self._rich_theme:
+            self._rich_theme = Theme(self._styles)
+        return self._rich_theme
+
     def load_theme_file(self, path: str, fail_early: bool = True) -> None:
         """Load a rich styles file.
 
@@ -164,7 +181,12 @@ class DTShTheme:
             DTShTheme.Error: Failed to load styles file.
         """
         try:
-            self._styles.update(Theme.read(path, encoding="utf-8").styles)
+            # Read only the DTSh styles: rich default styles are inherited
+            # once, when building the rich theme.
+            self._styles.update(
+                Theme.read(path, inherit=False, encoding="utf-8").styles
+            )
+            self._rich_theme = None
         except (
             OSError,
             StyleError,
@@ -22,29 +22,64 @@ On windows, the readline support will likely be disabled.
 """
 
 
-from typing import Callable, Sequence, List, Optional
+from typing import TYPE_CHECKING, Callable, Sequence, List, Optional, Tuple
 
+import locale
 import os
+import queue
 import sys
+import threading
 
 from dtsh.config import DTShConfig
 from dtsh.io import DTShOutput
 
-_has_readline = False
+# GNU readline is loaded on first use by an interactive session:
+# piped input (batch/script mode) shouldn't pay for its import and
+# initialization side effects.
+if TYPE_CHECKING:
+    import readline
+else:
+    readline = None
+_has_readline: Optional[bool] = None
 
-try:
-    # Allow all POSIX-like systems to load the gnureadline stand-alone module.
-    # https://pypi.org/project/gnureadline/
-    import gnureadline as readline  # type: ignore
 
-    _has_readline = True
-except ImportError:
-    try:
-        import readline
+def _load_readline() -> bool:
+    """Load GNU readline support, at most once.
 
-        _has_readline = True
-    except ImportError:
-        print("GNU readline support disabled.", file=sys.stderr)
+    Returns:
+        True if GNU readline support is available.
+    """
+    global readline, _has_readline  # pylint: disable=global-statement
+    if _has_readline is None:
+        _has_readline = False
+        try:
+            # Allow all POSIX-like systems to load the gnureadline stand-alone
+            # module.
+            # https://pypi.org/project/gnureadline/
+            # pylint: disable-next=import-outside-toplevel
+            import gnureadline as _readline  # type: ignore
+
+            _has_readline = True
+        except ImportError:
+            try:
+                # pylint: disable-next=import-outside-toplevel
+                import readline as _readline
+
+                _has_readline = True
+            except ImportError:
+                print("GNU readline support disabled.", file=sys.stderr)
+        if _has_readline:
+            readline = _readline
+    return _has_readline
+
+
+def _readline_is_libedit() -> bool:
+    # The readline module may be backed by libedit (e.g. on macOS),
+    # whose history file format differs from GNU readline's.
+    backend: Optional[str] = getattr(readline, "backend", None)
+    if backend:
+        return backend == "editline"
+    return "libedit" in (readline.__doc__ or "")
 
 
 _dtshconf: DTShConfig = DTShConfig.getinstance()
@@ -147,12 +182,51 @@ class DTShReadline:
     # Completer states, See rl_complete().
     _completer_states: List["DTShReadline.CompleterState"]
 
+    # Completion scope the completer states were computed for
+    # (RL buffer, begin and end indexes), reset on each new input line.
+    # Permits to not compute the completions again
+    # when the user hits TAB twice to display the matches.
+    _completer_scope: Optional[Tuple[str, int, int]]
+    _cache_completions: bool
+
     # Where to display completion matches and restore the command line.
     _stdout: DTShOutput
 
+    # Whether GNU readline is available and input comes from a TTY.
+    _enabled: bool
+
+    # Prompt to restore the command line with after completion display.
+    _prompt: str
+
     # Path to the command history file.
     _histfile: str
 
+    # Whether to append command lines to the history file as they're entered
+    # (GNU readline), rather than writing the history file on exit.
+    _hist_append: bool
+
+    # Last command line appended to the history file.
+    _hist_last: Optional[str]
+
+    # Pending history writes: command lines to append to the history file,
+    # or None to stop the history writer.
+    _hist_queue: "queue.Queue[Optional[str]]"
+
+    # Background history writer, started on first append.
+    _hist_writer: Optional[threading.Thread]
+
+    # Whether the history writer has processed all pending writes.
+    _hist_writer_done: bool
+
+    # Last error the history writer failed with, reported on exit.
+    _hist_error: Optional[str]
+
+    # How long to wait for pending history writes on exit (seconds).
+    HIST_WRITER_TIMEOUT = 2.0
+
+    # Block size for scanning the history file (64 KiB).
+    HIST_READ_BLKSIZE = 65536
+
     def __init__(
         self,
         stdout: DTShOutput,
@@ -161,7 +235,8 @@ class DTShReadline:
     ) -> None:
         """Initialize GNU readline integration.
 
-        If readline support is enabled, read history file and set RL hooks.
+        If readline support is enabled, and the standard input is a terminal,
+        read history file and set RL hooks.
 
         Args:
             stdout: Bound terminal to restore the command line after the
@@ -170,12 +245,27 @@ class DTShReadline:
             display_callback: The completion matches display callback.
         """
         self._stdout = stdout
+        self._prompt = _dtshconf.prompt_default
         self._completer_states = []
+        self._completer_scope = None
         self._completion_callback = completion_callback
         self._display_callback = display_callback
 
         self._histfile = _dtshconf.get_user_file("history")
-        if _has_readline:
+        self._hist_last = None
+        self._hist_queue = queue.Queue()
+        self._hist_writer = None
+        self._hist_writer_done = False
+        self._hist_error = None
+        # Don't bother GNU readline (and the command history)
+        # when command lines don't come from a terminal (e.g. piped input).
+        self._enabled = sys.stdin.isatty() and _load_readline()
+        # Caching requires the pre-input hook to invalidate the cache.
+        self._cache_completions = self._enabled and hasattr(
+            readline, "set_pre_input_hook"
+        )
+        self._hist_append = self._enabled and not _readline_is_libedit()
+        if self._enabled:
             self._rl_init()
             self.read_history()
 
@@ -185,10 +275,14 @@ class DTShReadline:
         Returns:
             The history file path, or None if the history file is unavailable.
         """
-        if _has_readline:
+        if self._enabled:
             if os.path.isfile(self._histfile):
                 try:
                     readline.read_history_file(self._histfile)
+                    self._hist_last = readline.get_history_item(
+                        readline.get_current_history_length()
+                    )
+                    self._truncate_history()
                     return self._histfile
                 except OSError as e:
                     print(
@@ -196,18 +290,45 @@ class DTShReadline:
                     )
         return None
 
+    def append_history(self, cmdline: str) -> None:
+        """Append a command line to the history file.
+
+        With GNU readline, command lines are appended to the history file
+        by a background thread with plain file I/O (which releases the GIL):
+        a slow history file won't stall the interactive prompt.
+        Otherwise (e.g. libedit), the command history is saved on exit.
+
+        Args:
+            cmdline: The command line the user has just entered.
+        """
+        # Like GNU readline, don't save consecutive duplicates.
+        if self._hist_append and cmdline and (cmdline != self._hist_last):
+            self._hist_last = cmdline
+            self._hist_write(cmdline)
+
     def save_history(self) -> Optional[str]:
         """Write command history file.
 
+        Waits for pending history writes to complete.
+
         Returns:
             The history file path, or None if failed to save history.
         """
-        if _has_readline:
-            try:
-                readline.write_history_file(self._histfile)
+        if self._enabled:
+            if self._hist_writer:
+                err = self._hist_stop()
+                if err:
+                    print(
+                        f"Failed to write command history: {err}",
+                        file=sys.stderr,
+                    )
+                    return None
                 return self._histfile
-            except OSError as e:
-                print(f"Failed to write command history: {e}", file=sys.stderr)
+            if not (self._hist_append and os.path.isfile(self._histfile)):
+                # Write the whole command history on exit (e.g. libedit),
+                # or just create the history file.
+                return self._write_history()
+            return self._histfile
         return None
 
     def rl_complete(self, cs_txt: str, state: int) -> Optional[str]:
@@ -221,15 +342,17 @@ class DTShReadline:
               candidates.
         """
         if state == 0:
-            self._completer_states.clear()
-
             rlbuf = readline.get_line_buffer()
             begin = readline.get_begidx()
             end = readline.get_endidx()
 
-            self._completer_states = self._completion_callback(
-                cs_txt, rlbuf, begin, end
-            )
+            scope = (rlbuf, begin, end)
+            if scope != self._completer_scope:
+                self._completer_states = self._completion_callback(
+                    cs_txt, rlbuf, begin, end
+                )
+                if self._cache_completions:
+                    self._completer_scope = scope
 
         try:
             return self._completer_states[state].rlstr
@@ -269,18 +392,18 @@ class DTShReadline:
         # Display completions.
         self._display_callback(self._stdout, self._completer_states)
 
-        # Restore command line.
-        self._stdout.write(_dtshconf.prompt_default, end="")
-        self._stdout.write(rlbuf, end="")
-        if n_back > 0:
-            # Move cursor back to insertion point.
-            # ANSI Cursor Back: CSI n D
-            self._stdout.write(f"\033[{n_back}D", end="")
+        # Restore command line with a single write:
+        # prompt, buffer content, and cursor position.
+        # ANSI Cursor Back (move cursor back to insertion point): CSI n D
+        cursor_back = f"\033[{n_back}D" if n_back > 0 else ""
+        self._stdout.write(f"{self._prompt}{rlbuf}{cursor_back}", end="")
         # Update stdout without sending LF.
         self._stdout.flush()
 
     def _rl_init(self) -> None:
         readline.set_completer(self.rl_complete)
+        if self._cache_completions:
+            readline.set_pre_input_hook(self._rl_pre_input_hook)
         readline.set_completer_delims(f" \t{os.linesep}")
         readline.parse_and_bind("tab: complete")
 
@@ -289,3 +412,94 @@ class DTShReadline:
             readline.set_completion_display_matches_hook(
                 self.rl_display_matches_hook
             )
+
+    def _rl_pre_input_hook(self) -> None:
+        # New input line: completions computed for the previous command line
+        # may not apply anymore (e.g. after "cd").
+        self._completer_scope = None
+
+    def _hist_write(self, cmdline: str) -> None:
+        # Hand a command line to the history writer, started on first write.
+        if not self._hist_writer:
+            self._hist_writer_done = False
+            self._hist_writer = threading.Thread(
+                target=self._hist_writer_loop,
+                name="dtsh-history",
+                daemon=True,
+            )
+            self._hist_writer.start()
+        self._hist_queue.put(cmdline)
+
+    def _hist_stop(self) -> Optional[str]:
+        # Stop the history writer once pending writes are processed.
+        # Answer an error message if some command lines were not saved.
+        if not self._hist_writer:
+            return None
+        self._hist_queue.put(None)
+        self._hist_writer.join(timeout=self.HIST_WRITER_TIMEOUT)
+        if self._hist_writer.is_alive():
+            # Pending command lines will be lost on exit.
+            return "timed out"
+        self._hist_writer = None
+        if not self._hist_writer_done:
+            return self._hist_error or "history writer stopped unexpectedly"
+        return self._hist_error
+
+    def _hist_writer_loop(self) -> None:
+        # Background history writer: appends command lines to the history
+        # file until stopped by a None item.
+        # GNU readline saves history entries as lines, in the locale encoding.
+        encoding = locale.getpreferredencoding(False)
+        while True:
+            cmdline = self._hist_queue.get()
+            if cmdline is None:
+                break
+            try:
+                with open(
+                    self._histfile,
+                    "a",
+                    encoding=encoding,
+                    errors="surrogateescape",
+                ) as f:
+                    f.write(f"{cmdline}\n")
+            except OSError as e:
+                self._hist_error = str(e)
+        # Not reached if the writer died from an unexpected error.
+        self._hist_writer_done = True
+
+    def _truncate_history(self) -> None:
+        # Reading a long history file is expensive: if the history file
+        # exceeds the configured maximum length (e.g. history written
+        # by a previous DTSh version), truncate it now, so that
+        # it won't slow down the next sessions.
+        maxlen = _dtshconf.pref_history_maxlen
+        if maxlen >= 0:
+            if DTShReadline._count_lines(self._histfile) > maxlen:
+                # Bound the history length for this write only: otherwise
+                # GNU readline would read and rewrite the history file
+                # each time it saves history.
+                readline.set_history_length(maxlen)
+                self._write_history()
+                readline.set_history_length(-1)
+
+    @staticmethod
+    def _count_lines(path: str) -> int:
+        # Count lines by scanning raw blocks (bytes.count() runs at C speed),
+        # without building line strings: unbuffered I/O, since we read
+        # blocks that are already multiples of the file system block size.
+        n_lines = 0
+        with open(path, "rb", buffering=0) as f:
+            read = f.read
+            buf = read(DTShReadline.HIST_READ_BLKSIZE)
+            while buf:
+                n_lines += buf.count(b"\n")
+                buf = read(DTShReadline.HIST_READ_BLKSIZE)
+        return n_lines
+
+    def _write_history(self) -> Optional[str]:
+        try:
+            readline.write_history_file(self._histfile)
+            return self._histfile
+        except OSError as e:
+            print(f"Failed to write command history: {e}", file=sys.stderr)
+        return None
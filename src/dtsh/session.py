@@ -46,6 +46,9 @@ from dtsh.builtins.board import DTShBuiltinBoard
 
 _dtshconf: DTShConfig = DTShConfig.getinstance()
 
+# Command lines that exit the shell.
+_EXIT_CMDS = frozenset(("q", "quit", "exit"))
+
 
 class DTShSession:
     """Base for devicetree shell sessions."""
@@ -58,6 +61,10 @@ class DTShSession:
 
     _last_err: Optional[BaseException]
 
+    # ANSI prompts, resolved once per session.
+    _prompt_default: str
+    _prompt_alt: str
+
     @classmethod
     def create(
         cls, dts_path: str, binding_dirs: Optional[Sequence[str]] = None
@@ -100,6 +107,8 @@ class DTShSession:
         """
         self._dtsh = sh
         self._last_err = None
+        self._prompt_default = _dtshconf.prompt_default
+        self._prompt_alt = _dtshconf.prompt_alt
 
         self._vt = vt or DTShVT()
         self._autocomp = autocomp or DTShAutocomp(self._dtsh)
@@ -142,7 +151,7 @@ class DTShSession:
                 self.close(interactive)
 
             if cmdline:
-                if cmdline.strip() in ["q", "quit", "exit"]:
+                if cmdline.strip() in _EXIT_CMDS:
                     # Exit DTSh process.
                     self.close(interactive)
 
@@ -199,6 +208,11 @@ class DTShSession:
                             # and never redirected.
                             out.flush()
 
+                if self._vt.is_tty():
+                    # Save interactive command lines to the history file,
+                    # in the background.
+                    self._rl.append_history(cmdline)
+
             # NOTE: Be sure to set prompt_sparse in preferences
             # when running batch sessions.
             if _dtshconf.prompt_sparse and self._vt.is_tty():
@@ -282,9 +296,7 @@ class DTShSession:
         """
         return [
             self._dtsh.pwd,
-            _dtshconf.prompt_alt
-            if self._last_err
-            else _dtshconf.prompt_default,
+            self._prompt_alt if self._last_err else self._prompt_default,
         ]
 
     def mk_prologue(self) -> Sequence[Any]:
@@ -98,6 +98,7 @@ def test_dtshconfig_defaults() -> None:
 
     # General preferences.
     assert 255 == cfg_defaults.pref_redir2_maxwidth
+    assert 5000 == cfg_defaults.pref_history_maxlen
     assert not cfg_defaults.pref_always_longfmt
     assert cfg_defaults.pref_sizes_si
     assert not cfg_defaults.pref_hex_upper
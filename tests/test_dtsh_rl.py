@@ -0,0 +1,44 @@
+# Copyright (c) 2023 Christophe Dufaza <chris@openmarl.org>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for the dtsh.rl module."""
+
+# Relax pylint a bit for unit tests.
+# pylint: disable=missing-function-docstring
+# pylint: disable=protected-access
+
+
+from pathlib import Path
+
+from dtsh.io import DTShOutput
+from dtsh.rl import DTShReadline
+
+
+def mk_readline(histfile: Path) -> DTShReadline:
+    # Command lines won't come from a TTY: GNU readline is not involved.
+    rl = DTShReadline(DTShOutput(), lambda *args: [])
+    rl._histfile = str(histfile)
+    return rl
+
+
+def test_dtsh_readline_hist_writer(tmp_path: Path) -> None:
+    histfile = tmp_path / "history"
+    rl = mk_readline(histfile)
+
+    cmdlines = ["ls", "cd /soc", "tree"]
+    for cmdline in cmdlines:
+        rl._hist_write(cmdline)
+    assert rl._hist_stop() is None
+    assert histfile.read_text().splitlines() == cmdlines
+
+    # Appends to the history file on restart.
+    rl._hist_write("pwd")
+    assert rl._hist_stop() is None
+    assert histfile.read_text().splitlines() == [*cmdlines, "pwd"]
+
+
+def test_dtsh_readline_hist_writer_error(tmp_path: Path) -> None:
+    rl = mk_readline(tmp_path / "nonexistent" / "history")
+    rl._hist_write("ls")
+    assert rl._hist_stop()
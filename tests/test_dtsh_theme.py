@@ -38,6 +38,22 @@ def test_dtshtheme_load_theme_file() -> None:
         theme.load_theme_file("not/a/styles/file.ini")
 
 
+def test_dtshtheme_rich_theme() -> None:
+    theme = DTShTheme(DTShTests.get_resource_path("theme", "test.ini"))
+    rich_theme = theme.rich_theme
+    assert rich_theme.styles["test.red"].color == Color.parse("red")
+    # Shared by all consoles.
+    assert rich_theme is theme.rich_theme
+    # Rich default styles are inherited by the rich theme only.
+    assert "repr.number" not in theme.styles
+    assert rich_theme.styles["repr.number"]
+
+    # Loading a theme file invalidates the rich theme.
+    theme.load_theme_file(DTShTests.get_resource_path("theme", "override.ini"))
+    assert rich_theme is not theme.rich_theme
+    assert theme.rich_theme.styles["test.default"].color == Color.parse("green")
+
+
 def test_dtshtheme_defaults() -> None:
     # All these constants MUST have suitable values in the bundled theme.ini.
     theme_ini = os.path.abspath(